@@ -1,10 +1,17 @@
+import functools
 import json
 import os
+import re
 from dataclasses import asdict, dataclass, field
+from types import MappingProxyType
 from typing import Any, Dict, List, Literal
 
 DEFAULT_TRANSLATION_LANG_MAP = "de:de-DE,en:en-US,es:es-ES,fr:fr-FR,hi:hi-IN,it:it-IT,ja:ja-JP,pt:pt-BR,ru:ru-RU,zh:zh-CN"
-REDACTED_CONFIG_KEYS = {"api_key", "password", "secret", "token"}
+REDACTED_CONFIG_KEYS = frozenset(("api_key", "password", "secret", "token"))
+# Any other value, including an empty string, reads as False
+_BOOL_ENV_TRUE = frozenset(("true", "1", "t"))
+# Splits comma-separated values and drops the whitespace around each comma
+_CSV_SPLIT = re.compile(r"\s*,\s*")
 
 
 def _get_float_env(key: str, default: float) -> float:
@@ -22,7 +29,7 @@ def _get_bool_env(key: str, default: bool | None) -> bool | None:
     if val is None:
         return default
 
-    return val.lower() in ("true", "1", "t")
+    return val.lower() in _BOOL_ENV_TRUE
 
 
 def _get_list_env(key: str, default: List[str] | None) -> List[str] | None:
@@ -34,7 +41,7 @@ def _get_list_env(key: str, default: List[str] | None) -> List[str] | None:
     if not val:
         return []
 
-    return [item.strip() for item in val.split(",")]
+    return _CSV_SPLIT.split(val.strip())
 
 
 def _get_json_env(key: str) -> Any | None:
@@ -48,24 +55,30 @@ def _get_json_env(key: str) -> Any | None:
         return None
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_map(val: str) -> MappingProxyType[str, str]:
+    lang_map = {}
+
+    for pair in _CSV_SPLIT.split(val.strip()):
+        lang, sep, bbb_locale = pair.partition(":")
+        if sep:
+            lang_map[lang.rstrip()] = bbb_locale.lstrip()
+
+    return MappingProxyType(lang_map)
+
+
 def _get_map_env(key: str, default_str: str = "") -> Dict[str, str]:
     val = os.getenv(key, default_str)
 
     if not val:
         return {}
 
-    lang_map = {}
-
     try:
-        pairs = val.split(",")
-        for pair in pairs:
-            if ":" in pair:
-                lang, bbb_locale = pair.split(":", 1)
-                lang_map[lang.strip()] = bbb_locale.strip()
+        # Copy so callers get a regular dict they're free to mutate
+        return dict(_parse_map(val))
     except Exception as e:
         print(f"Warning: Could not parse {key}: {e}")
-
-    return lang_map
+        return {}
 
 
 @dataclass
@@ -75,7 +88,11 @@ class RedisConfig:
     password: str = field(default_factory=lambda: os.getenv("REDIS_PASSWORD", ""))
 
 
-redis_config = RedisConfig()
+# Like get_gladia_config(), built on first use so values loaded from .env
+# (after import) are picked up.
+@functools.lru_cache(maxsize=1)
+def get_redis_config() -> RedisConfig:
+    return RedisConfig()
 
 
 # This is a mapping of the Gladia STT plugin configuration options to environment variables.
@@ -220,7 +237,12 @@ class GladiaConfig:
         return {k: v for k, v in data.items() if v is not None}
 
 
-gladia_config = GladiaConfig()
+# Environment variables don't change at runtime, so a single GladiaConfig is
+# built on first use and shared. Tests that change the environment can reset
+# it with get_gladia_config.cache_clear().
+@functools.lru_cache(maxsize=1)
+def get_gladia_config() -> GladiaConfig:
+    return GladiaConfig()
 
 
 def redact_config_values(value: object, key: str | None = None) -> object:
@@ -238,7 +260,7 @@ def redact_config_values(value: object, key: str | None = None) -> object:
 
 def get_redacted_app_config() -> Dict[str, Any]:
     config_payload = {
-        "redis": asdict(redis_config),
-        "gladia": asdict(gladia_config),
+        "redis": asdict(get_redis_config()),
+        "gladia": asdict(get_gladia_config()),
     }
     return redact_config_values(config_payload)
@@ -1,23 +1,31 @@
-from collections import defaultdict
 import asyncio
 
 
 class EventEmitter:
     def __init__(self):
-        self._events = defaultdict(list)
+        # Callbacks are kept in tuples so emit() can hand the current set to
+        # the dispatch task as-is, without copying.
+        self._events = {}
 
     def on(self, event_name, func=None):
         def decorator(f):
-            self._events[event_name].append(f)
+            self._events[event_name] = self._events.get(event_name, ()) + (f,)
             return f
 
         if func:
             return decorator(func)
         return decorator
 
-    async def _emit_async(self, event_name, *args, **kwargs):
-        for callback in self._events[event_name]:
+    async def _emit_async(self, callbacks, args, kwargs):
+        for callback in callbacks:
             await callback(*args, **kwargs)
 
     def emit(self, event_name, *args, **kwargs):
-        asyncio.create_task(self._emit_async(event_name, *args, **kwargs))
+        # Callbacks are resolved now, not when the dispatch task runs: a
+        # callback registered after emit() doesn't receive this event.
+        callbacks = self._events.get(event_name)
+
+        if not callbacks:
+            return
+
+        asyncio.create_task(self._emit_async(callbacks, args, kwargs))
@@ -10,7 +10,7 @@ from livekit import rtc
 
 from redis_manager import RedisManager
 from gladia_stt_agent import GladiaSttAgent
-from config import get_redacted_app_config, gladia_config, redis_config
+from config import get_gladia_config, get_redacted_app_config, get_redis_config
 from utils import coerce_min_utterance_length_seconds, coerce_partial_utterances
 
 load_dotenv()
@@ -33,7 +33,9 @@ async def entrypoint(ctx: JobContext):
     nest_asyncio.apply()
     _log_startup_configuration()
 
-    redis_manager = RedisManager(redis_config)
+    gladia_config = get_gladia_config()
+
+    redis_manager = RedisManager(get_redis_config())
     agent = GladiaSttAgent(gladia_config)
 
     async def on_redis_message(message_data: str):
@@ -130,8 +130,8 @@ class RedisManager:
                 },
                 "body": {
                     "transcriptId": f"{user_id}-{locale}-{start}",
-                    "start": str(start),
-                    "end": str(end),
+                    "start": f"{start}",
+                    "end": f"{end}",
                     "text": "",
                     "transcript": transcript,
                     "locale": locale,
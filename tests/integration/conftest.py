@@ -1,29 +1,114 @@
 import os
 
 import pytest
+import pytest_asyncio
+from aiohttp import WSMsgType, web
 
 from livekit.agents import utils
+from livekit.plugins.gladia import STT as GladiaSTT
+from livekit.plugins.gladia.stt import BASE_URL as GLADIA_BASE_URL
 
+MOCK_API_KEY = "mock-gladia-key"
+MOCK_SESSION_ID = "mock-session"
 
-@pytest.fixture
+
+def _use_mock_provider() -> bool:
+    return os.environ.get("USE_MOCK_PROVIDER", "").lower() in ("1", "true")
+
+
+async def _mock_init_live_session(request: web.Request) -> web.Response:
+    ws_url = f"ws://{request.host}/v2/live/ws"
+    return web.json_response({"id": MOCK_SESSION_ID, "url": ws_url})
+
+
+async def _mock_live_ws(request: web.Request) -> web.WebSocketResponse:
+    """Replay a minimal Gladia live session: accept audio, then on
+    ``stop_recording`` answer with an empty final transcript and close."""
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+
+    async for msg in ws:
+        if msg.type != WSMsgType.TEXT:
+            continue
+        if msg.json().get("type") == "stop_recording":
+            await ws.send_json(
+                {
+                    "type": "transcript",
+                    "data": {"is_final": True, "utterance": {"text": ""}},
+                }
+            )
+            await ws.send_json({"type": "post_final_transcript"})
+            break
+
+    await ws.close()
+    return ws
+
+
+@pytest_asyncio.fixture(scope="session")
+async def gladia_endpoint():
+    """Base URL of the Gladia live API used by the integration tests.
+
+    With USE_MOCK_PROVIDER set, a local aiohttp server stands in for Gladia
+    so the suite runs offline; otherwise the real service is used.
+    """
+    if not _use_mock_provider():
+        yield GLADIA_BASE_URL
+        return
+
+    app = web.Application()
+    app.router.add_post("/v2/live", _mock_init_live_session)
+    app.router.add_get("/v2/live/ws", _mock_live_ws)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}/v2/live"
+    finally:
+        await runner.cleanup()
+
+
+@pytest_asyncio.fixture(scope="session")
 async def job_process():
     """Initialize the LiveKit HTTP context, simulating an agent job process.
 
     This is required for plugins (e.g. GladiaSTT) that use the managed
     http_context session internally, matching the production code path.
+    The context is session-scoped so every integration test reuses the
+    same aiohttp session (and its TLS connection pool).
     """
     utils.http_context._new_session_ctx()
     yield
     await utils.http_context._close_http_ctx()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def gladia_stt(job_process, gladia_endpoint):
+    """A single Gladia STT client shared by all integration tests.
+
+    Tests open and close their own streams on it so they stay isolated.
+    """
+    if _use_mock_provider():
+        api_key = MOCK_API_KEY
+    else:
+        api_key = os.environ["GLADIA_API_KEY"]
+
+    async with GladiaSTT(
+        api_key=api_key, sample_rate=16000, base_url=gladia_endpoint
+    ) as stt:
+        yield stt
+
+
 def pytest_collection_modifyitems(config, items):
-    """Skip all integration tests when GLADIA_API_KEY is not set."""
-    if os.environ.get("GLADIA_API_KEY"):
+    """Skip all integration tests when neither GLADIA_API_KEY nor
+    USE_MOCK_PROVIDER is set."""
+    if os.environ.get("GLADIA_API_KEY") or _use_mock_provider():
         return
 
     skip_marker = pytest.mark.skip(
-        reason="GLADIA_API_KEY environment variable is not set"
+        reason="neither GLADIA_API_KEY nor USE_MOCK_PROVIDER is set"
     )
     for item in items:
         if item.get_closest_marker("integration"):
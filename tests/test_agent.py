@@ -1,8 +1,11 @@
 import asyncio
 import contextlib
+import inspect
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from livekit import rtc
 from livekit.agents import stt
 from livekit.plugins.gladia import STT as GladiaSTT
@@ -11,19 +14,79 @@ from config import GladiaConfig
 from gladia_stt_agent import GladiaSttAgent
 
 
+# Attribute names of GladiaSTT, introspected once. Passing a plain list as the
+# mock spec avoids re-walking the class on every _make_agent() call.
+_GLADIA_STT_SPEC = dir(GladiaSTT)
+# A name-list spec loses the async detection of a class spec, so the
+# coroutine methods are recorded here and patched in as AsyncMocks.
+_GLADIA_STT_ASYNC_METHODS = tuple(
+    name
+    for name in _GLADIA_STT_SPEC
+    if inspect.iscoroutinefunction(getattr(GladiaSTT, name, None))
+)
+
+
+def _make_gladia_stt_mock(*args, **kwargs):
+    mock = MagicMock(spec=_GLADIA_STT_SPEC)
+    for name in _GLADIA_STT_ASYNC_METHODS:
+        setattr(mock, name, AsyncMock())
+    return mock
+
+
 def _make_agent(interim_results=None, **kwargs):
     config = GladiaConfig(api_key="fake-key", interim_results=interim_results, **kwargs)
-    with patch("gladia_stt_agent.GladiaSTT", spec=GladiaSTT):
+    with patch("gladia_stt_agent.GladiaSTT", new=_make_gladia_stt_mock):
         agent = GladiaSttAgent(config)
     return agent
 
 
-def _make_track_subscribed_args(source=rtc.TrackSource.SOURCE_MICROPHONE):
-    mock_track = MagicMock()
-    mock_publication = MagicMock()
-    mock_publication.source = source
-    mock_participant = MagicMock()
-    return mock_track, mock_publication, mock_participant
+# _on_track_subscribed only reads these, so the mocks are built once and
+# re-pointed at the identity/source each test needs.
+_TRACK_SUBSCRIBED_TRACK = MagicMock()
+_TRACK_SUBSCRIBED_PUBLICATION = MagicMock()
+_TRACK_SUBSCRIBED_PARTICIPANT = MagicMock()
+
+
+def _make_track_subscribed_args(identity, source=rtc.TrackSource.SOURCE_MICROPHONE):
+    _TRACK_SUBSCRIBED_PUBLICATION.source = source
+    _TRACK_SUBSCRIBED_PARTICIPANT.identity = identity
+    return (
+        _TRACK_SUBSCRIBED_TRACK,
+        _TRACK_SUBSCRIBED_PUBLICATION,
+        _TRACK_SUBSCRIBED_PARTICIPANT,
+    )
+
+
+class _AIter:
+    """Minimal async iterator standing in for audio/STT streams.
+
+    Yields ``items`` in order, or raises ``exc`` on the first iteration.
+    """
+
+    def __init__(self, items=(), exc=None):
+        self._items = iter(items)
+        self._exc = exc
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._exc is not None:
+            raise self._exc
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _FakeSttStream(_AIter):
+    """An ``_AIter`` with the input-side methods the pipeline calls."""
+
+    def push_frame(self, frame):
+        pass
+
+    def flush(self):
+        pass
 
 
 def _make_agent_with_room(interim_results=None, participants=None, **kwargs):
@@ -50,23 +113,31 @@ def _make_participant(identity, audio_track=None):
     return participant
 
 
-class TestSanitizeLocale:
-    def test_strips_region_from_bcp47_locale(self):
-        agent = _make_agent()
-        assert agent._sanitize_locale("en-US") == "en"
-        assert agent._sanitize_locale("pt-BR") == "pt"
-        assert agent._sanitize_locale("zh-CN") == "zh"
-        assert agent._sanitize_locale("fr-FR") == "fr"
+@pytest.fixture(scope="module")
+def shared_agent():
+    """A single agent for tests that only exercise stateless helpers."""
+    return _make_agent()
 
-    def test_returns_language_code_unchanged_when_no_region(self):
-        agent = _make_agent()
-        assert agent._sanitize_locale("en") == "en"
-        assert agent._sanitize_locale("de") == "de"
 
-    def test_lowercases_language_code(self):
-        agent = _make_agent()
-        assert agent._sanitize_locale("EN-US") == "en"
-        assert agent._sanitize_locale("PT") == "pt"
+class TestSanitizeLocale:
+    @pytest.mark.parametrize(
+        "locale,expected",
+        [
+            # Strips the region from BCP 47 locales
+            ("en-US", "en"),
+            ("pt-BR", "pt"),
+            ("zh-CN", "zh"),
+            ("fr-FR", "fr"),
+            # Returns language codes without a region unchanged
+            ("en", "en"),
+            ("de", "de"),
+            # Lowercases the language code
+            ("EN-US", "en"),
+            ("PT", "pt"),
+        ],
+    )
+    def test_sanitize_locale(self, shared_agent, locale, expected):
+        assert shared_agent._sanitize_locale(locale) == expected
 
 
 class TestStopTranscriptionForUser:
@@ -162,9 +233,8 @@ class TestOnTrackSubscribed:
         agent = _make_agent()
         agent.participant_settings["user_1"] = {"locale": "en-US", "provider": "gladia"}
         mock_track, mock_publication, mock_participant = _make_track_subscribed_args(
-            source=rtc.TrackSource.SOURCE_CAMERA
+            "user_1", source=rtc.TrackSource.SOURCE_CAMERA
         )
-        mock_participant.identity = "user_1"
 
         with patch.object(agent, "start_transcription_for_user") as mock_start:
             agent._on_track_subscribed(mock_track, mock_publication, mock_participant)
@@ -173,8 +243,9 @@ class TestOnTrackSubscribed:
     def test_skips_transcription_when_no_settings(self):
         """Regression: must not raise when no settings exist for the participant."""
         agent = _make_agent()
-        mock_track, mock_publication, mock_participant = _make_track_subscribed_args()
-        mock_participant.identity = "user_no_settings"
+        mock_track, mock_publication, mock_participant = _make_track_subscribed_args(
+            "user_no_settings"
+        )
 
         with patch.object(agent, "start_transcription_for_user") as mock_start:
             agent._on_track_subscribed(mock_track, mock_publication, mock_participant)
@@ -184,8 +255,9 @@ class TestOnTrackSubscribed:
         """Regression: must not raise when provider is set but locale is absent."""
         agent = _make_agent()
         agent.participant_settings["user_1"] = {"provider": "gladia"}  # no locale
-        mock_track, mock_publication, mock_participant = _make_track_subscribed_args()
-        mock_participant.identity = "user_1"
+        mock_track, mock_publication, mock_participant = _make_track_subscribed_args(
+            "user_1"
+        )
 
         with patch.object(agent, "start_transcription_for_user") as mock_start:
             agent._on_track_subscribed(mock_track, mock_publication, mock_participant)
@@ -195,8 +267,9 @@ class TestOnTrackSubscribed:
         """Regression: must not raise when locale is set but provider is absent."""
         agent = _make_agent()
         agent.participant_settings["user_1"] = {"locale": "en-US"}  # no provider
-        mock_track, mock_publication, mock_participant = _make_track_subscribed_args()
-        mock_participant.identity = "user_1"
+        mock_track, mock_publication, mock_participant = _make_track_subscribed_args(
+            "user_1"
+        )
 
         with patch.object(agent, "start_transcription_for_user") as mock_start:
             agent._on_track_subscribed(mock_track, mock_publication, mock_participant)
@@ -205,8 +278,9 @@ class TestOnTrackSubscribed:
     def test_starts_transcription_when_locale_and_provider_present(self):
         agent = _make_agent()
         agent.participant_settings["user_1"] = {"locale": "en-US", "provider": "gladia"}
-        mock_track, mock_publication, mock_participant = _make_track_subscribed_args()
-        mock_participant.identity = "user_1"
+        mock_track, mock_publication, mock_participant = _make_track_subscribed_args(
+            "user_1"
+        )
 
         with patch.object(agent, "start_transcription_for_user") as mock_start:
             agent._on_track_subscribed(mock_track, mock_publication, mock_participant)
@@ -214,6 +288,10 @@ class TestOnTrackSubscribed:
 
 
 class TestStartTranscriptionForUser:
+    @pytest.fixture(autouse=True)
+    def _patch_audio_stream(self, monkeypatch):
+        monkeypatch.setattr("gladia_stt_agent.rtc.AudioStream", MagicMock())
+
     def test_logs_error_when_participant_not_found(self, caplog):
         """Participant not in room → error log, no stream created."""
         agent = _make_agent_with_room(participants={})
@@ -258,21 +336,20 @@ class TestStartTranscriptionForUser:
         participant = _make_participant("user_1", audio_track=mock_track)
         agent = _make_agent_with_room(participants={"pid": participant})
 
-        with patch("gladia_stt_agent.rtc.AudioStream"):
-            agent.start_transcription_for_user("user_1", "en-US", "gladia")
+        agent.start_transcription_for_user("user_1", "en-US", "gladia")
 
-            assert "user_1" in agent.processing_info
-            info = agent.processing_info["user_1"]
-            assert "stream" in info
-            assert "task" in info
-            # Settings should be persisted
-            assert agent.participant_settings["user_1"]["locale"] == "en-US"
-            assert agent.participant_settings["user_1"]["provider"] == "gladia"
+        assert "user_1" in agent.processing_info
+        info = agent.processing_info["user_1"]
+        assert "stream" in info
+        assert "task" in info
+        # Settings should be persisted
+        assert agent.participant_settings["user_1"]["locale"] == "en-US"
+        assert agent.participant_settings["user_1"]["provider"] == "gladia"
 
-            # Cancel the background task so it doesn't leak after the patch exits
-            info["task"].cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await info["task"]
+        # Cancel the background task so it doesn't leak after the patch is undone
+        info["task"].cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await info["task"]
 
     async def test_sanitizes_locale_before_creating_stream(self):
         """Locale 'pt-BR' should be sanitized to 'pt' for Gladia."""
@@ -281,14 +358,13 @@ class TestStartTranscriptionForUser:
         participant = _make_participant("user_1", audio_track=mock_track)
         agent = _make_agent_with_room(participants={"pid": participant})
 
-        with patch("gladia_stt_agent.rtc.AudioStream"):
-            agent.start_transcription_for_user("user_1", "pt-BR", "gladia")
-            agent.stt.stream.assert_called_once_with(language="pt")
+        agent.start_transcription_for_user("user_1", "pt-BR", "gladia")
+        agent.stt.stream.assert_called_once_with(language="pt")
 
-            # Cancel the background task to avoid leaking past the patch
-            agent.processing_info["user_1"]["task"].cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await agent.processing_info["user_1"]["task"]
+        # Cancel the background task to avoid leaking past the patch
+        agent.processing_info["user_1"]["task"].cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await agent.processing_info["user_1"]["task"]
 
 
 class TestRunTranscriptionPipeline:
@@ -300,11 +376,9 @@ class TestRunTranscriptionPipeline:
         mock_track = MagicMock()
 
         # Simulate an audio stream that raises CancelledError immediately
-        mock_audio_stream = AsyncMock()
-        mock_audio_stream.__aiter__.side_effect = asyncio.CancelledError
+        mock_audio_stream = _AIter(exc=asyncio.CancelledError)
 
-        mock_stt_stream = AsyncMock()
-        mock_stt_stream.__aiter__.return_value = iter([])
+        mock_stt_stream = _FakeSttStream()
 
         agent.processing_info["user_1"] = {
             "stream": mock_stt_stream,
@@ -326,14 +400,12 @@ class TestRunTranscriptionPipeline:
         mock_track = MagicMock()
 
         # Empty audio stream (finishes immediately)
-        mock_audio_stream = AsyncMock()
-        mock_audio_stream.__aiter__.return_value = iter([])
+        mock_audio_stream = _AIter()
 
         # STT stream that yields one FINAL_TRANSCRIPT event
         mock_event = MagicMock()
         mock_event.type = stt.SpeechEventType.FINAL_TRANSCRIPT
-        mock_stt_stream = AsyncMock()
-        mock_stt_stream.__aiter__.return_value = iter([mock_event])
+        mock_stt_stream = _FakeSttStream([mock_event])
 
         emitted = []
         agent.on("final_transcript", lambda **kw: emitted.append(kw))
@@ -342,7 +414,6 @@ class TestRunTranscriptionPipeline:
             await agent._run_transcription_pipeline(
                 mock_participant, mock_track, mock_stt_stream
             )
-            await asyncio.sleep(0)
 
         assert len(emitted) == 1
         assert emitted[0]["participant"] is mock_participant
@@ -355,13 +426,11 @@ class TestRunTranscriptionPipeline:
         mock_participant.identity = "user_1"
         mock_track = MagicMock()
 
-        mock_audio_stream = AsyncMock()
-        mock_audio_stream.__aiter__.return_value = iter([])
+        mock_audio_stream = _AIter()
 
         mock_event = MagicMock()
         mock_event.type = stt.SpeechEventType.INTERIM_TRANSCRIPT
-        mock_stt_stream = AsyncMock()
-        mock_stt_stream.__aiter__.return_value = iter([mock_event])
+        mock_stt_stream = _FakeSttStream([mock_event])
 
         emitted = []
         agent.on("interim_transcript", lambda **kw: emitted.append(kw))
@@ -370,7 +439,6 @@ class TestRunTranscriptionPipeline:
             await agent._run_transcription_pipeline(
                 mock_participant, mock_track, mock_stt_stream
             )
-            await asyncio.sleep(0)
 
         assert len(emitted) == 1
 
@@ -381,13 +449,11 @@ class TestRunTranscriptionPipeline:
         mock_participant.identity = "user_1"
         mock_track = MagicMock()
 
-        mock_audio_stream = AsyncMock()
-        mock_audio_stream.__aiter__.return_value = iter([])
+        mock_audio_stream = _AIter()
 
         mock_event = MagicMock()
         mock_event.type = stt.SpeechEventType.INTERIM_TRANSCRIPT
-        mock_stt_stream = AsyncMock()
-        mock_stt_stream.__aiter__.return_value = iter([mock_event])
+        mock_stt_stream = _FakeSttStream([mock_event])
 
         emitted = []
         agent.on("interim_transcript", lambda **kw: emitted.append(kw))
@@ -396,7 +462,6 @@ class TestRunTranscriptionPipeline:
             await agent._run_transcription_pipeline(
                 mock_participant, mock_track, mock_stt_stream
             )
-            await asyncio.sleep(0)
 
         assert len(emitted) == 0
 
@@ -407,11 +472,9 @@ class TestRunTranscriptionPipeline:
         mock_participant.identity = "user_1"
         mock_track = MagicMock()
 
-        mock_audio_stream = AsyncMock()
-        mock_audio_stream.__aiter__.side_effect = RuntimeError("boom")
+        mock_audio_stream = _AIter(exc=RuntimeError("boom"))
 
-        mock_stt_stream = AsyncMock()
-        mock_stt_stream.__aiter__.return_value = iter([])
+        mock_stt_stream = _FakeSttStream()
 
         agent.processing_info["user_1"] = {
             "stream": mock_stt_stream,
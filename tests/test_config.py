@@ -9,6 +9,9 @@ from config import (
     _get_json_env,
     _get_list_env,
     _get_map_env,
+    get_gladia_config,
+    get_redacted_app_config,
+    get_redis_config,
     redact_config_values,
 )
 
@@ -49,6 +52,12 @@ class TestGetFloatEnv:
         with pytest.raises(ValueError):
             _get_float_env("TEST_FLOAT", 0.0)
 
+    def test_reflects_env_changes_between_calls(self, monkeypatch):
+        monkeypatch.setenv("TEST_FLOAT", "1.5")
+        assert _get_float_env("TEST_FLOAT", 0.0) == pytest.approx(1.5)
+        monkeypatch.setenv("TEST_FLOAT", "2.5")
+        assert _get_float_env("TEST_FLOAT", 0.0) == pytest.approx(2.5)
+
 
 class TestGetListEnv:
     def test_returns_default_when_not_set(self, monkeypatch):
@@ -72,6 +81,12 @@ class TestGetListEnv:
         monkeypatch.setenv("TEST_LIST", "en")
         assert _get_list_env("TEST_LIST", None) == ["en"]
 
+    def test_returns_independent_lists(self, monkeypatch):
+        monkeypatch.setenv("TEST_LIST", "en,fr")
+        first = _get_list_env("TEST_LIST", None)
+        first.append("de")
+        assert _get_list_env("TEST_LIST", None) == ["en", "fr"]
+
 
 class TestGetMapEnv:
     def test_parses_default_translation_map(self):
@@ -191,6 +206,17 @@ class TestRedactConfigValues:
         result = redact_config_values(["en", "fr", "de"])
         assert result == ["en", "fr", "de"]
 
+    def test_redacts_dicts_nested_in_lists(self):
+        payload = {"servers": [{"host": "a", "token": "t-1"}, {"host": "b"}]}
+        result = redact_config_values(payload)
+        assert result["servers"][0] == {"host": "a", "token": "***REDACTED***"}
+        assert result["servers"][1] == {"host": "b"}
+
+    def test_does_not_mutate_input(self):
+        payload = {"redis": {"password": "redis-pass"}, "langs": ["en"]}
+        redact_config_values(payload)
+        assert payload == {"redis": {"password": "redis-pass"}, "langs": ["en"]}
+
 
 class TestGladiaConfigDefaults:
     @pytest.fixture(autouse=True)
@@ -199,6 +225,9 @@ class TestGladiaConfigDefaults:
         for key in list(os.environ):
             if key.startswith("GLADIA_"):
                 monkeypatch.delenv(key, raising=False)
+        get_gladia_config.cache_clear()
+        yield
+        get_gladia_config.cache_clear()
 
     def test_code_switching_defaults_to_false(self):
         config = GladiaConfig()
@@ -223,3 +252,34 @@ class TestGladiaConfigDefaults:
         config = GladiaConfig()
         assert config.min_confidence_interim == pytest.approx(0.2)
         assert config.min_confidence_final == pytest.approx(0.5)
+
+    def test_get_gladia_config_returns_shared_instance(self, monkeypatch):
+        monkeypatch.setenv("GLADIA_MODEL", "solaria-1")
+        config = get_gladia_config()
+        assert config.model == "solaria-1"
+        assert get_gladia_config() is config
+
+
+class TestGetRedisConfig:
+    @pytest.fixture(autouse=True)
+    def _reset_cached_configs(self):
+        get_redis_config.cache_clear()
+        get_gladia_config.cache_clear()
+        yield
+        get_redis_config.cache_clear()
+        get_gladia_config.cache_clear()
+
+    def test_reads_env_on_first_use(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "redis.internal")
+        monkeypatch.setenv("REDIS_PORT", "6380")
+        config = get_redis_config()
+        assert config.host == "redis.internal"
+        assert config.port == 6380
+        assert get_redis_config() is config
+
+    def test_redacted_app_config_uses_lazy_configs(self, monkeypatch):
+        monkeypatch.setenv("REDIS_PASSWORD", "redis-pass")
+        monkeypatch.setenv("GLADIA_API_KEY", "gladia-key")
+        result = get_redacted_app_config()
+        assert result["redis"]["password"] == "***REDACTED***"
+        assert result["gladia"]["api_key"] == "***REDACTED***"
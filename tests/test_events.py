@@ -1,4 +1,5 @@
 import asyncio
+from unittest.mock import patch
 
 from events import EventEmitter
 
@@ -53,6 +54,14 @@ class TestEventEmitter:
         emitter.emit("no_listeners")
         await asyncio.sleep(0)
 
+    async def test_emit_without_listeners_schedules_nothing(self):
+        emitter = EventEmitter()
+
+        with patch("events.asyncio.create_task") as mock_create_task:
+            emitter.emit("no_listeners", value=1)
+
+        mock_create_task.assert_not_called()
+
     async def test_emit_passes_kwargs_to_callbacks(self):
         emitter = EventEmitter()
         received = {}
@@ -84,3 +93,21 @@ class TestEventEmitter:
 
         assert a_calls == [True]
         assert b_calls == []
+
+    async def test_callbacks_registered_after_emit_do_not_fire(self):
+        emitter = EventEmitter()
+        calls = []
+
+        @emitter.on("data")
+        async def early(**kwargs):
+            calls.append("early")
+
+        emitter.emit("data")
+
+        @emitter.on("data")
+        async def late(**kwargs):
+            calls.append("late")
+
+        await asyncio.sleep(0)
+
+        assert calls == ["early"]
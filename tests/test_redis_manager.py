@@ -1,3 +1,4 @@
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 from config import RedisConfig
@@ -113,3 +114,23 @@ class TestPublishUpdateTranscriptPubMsg:
         mock_client.publish.assert_called_once()
         call_args = mock_client.publish.call_args
         assert call_args[0][0] == RedisManager.TO_AKKA_APPS_CHANNEL
+
+    async def test_publishes_json_encoded_message(self):
+        manager = _make_manager()
+        mock_client = AsyncMock()
+        manager.pub_client = mock_client
+
+        speech_data = MagicMock()
+        speech_data.text = "Test transcript"
+        speech_data.start_time = 0.5
+        speech_data.end_time = 2.0
+
+        await manager.publish_update_transcript_pub_msg(
+            meeting_id="meeting-1",
+            user_id="user-1",
+            transcript_data=speech_data,
+            locale="en-US",
+        )
+
+        payload = json.loads(mock_client.publish.call_args[0][1])
+        assert payload["core"]["body"]["transcript"] == "Test transcript"
@@ -37,6 +37,10 @@ class TestCoercePartialUtterances:
         assert coerce_partial_utterances("maybe", default=False) is False
         assert coerce_partial_utterances("maybe", default=True) is True
 
+    def test_overlong_string_returns_default(self):
+        assert coerce_partial_utterances("true" + " " * 32, default=False) is False
+        assert coerce_partial_utterances("x" * 1024, default=True) is True
+
     def test_none_returns_default(self):
         assert coerce_partial_utterances(None, default=False) is False
         assert coerce_partial_utterances(None, default=True) is True
@@ -73,6 +77,13 @@ class TestCoerceMinUtteranceLengthSeconds:
         assert result == pytest.approx(0.5)
         assert any("Invalid" in r.message for r in caplog.records)
 
+    def test_overflowing_int_returns_default_with_warning(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            result = coerce_min_utterance_length_seconds(10**400, default=0.5)
+
+        assert result == pytest.approx(0.5)
+        assert any("Invalid" in r.message for r in caplog.records)
+
     def test_negative_value_is_clamped_to_default_with_warning(self, caplog):
         with caplog.at_level(logging.WARNING):
             result = coerce_min_utterance_length_seconds(-1.0, default=0.0)
@@ -1,38 +1,57 @@
+import functools
 import logging
 
+_TRUTHY_STRINGS = frozenset(("true", "1", "t", "yes", "y"))
+_FALSY_STRINGS = frozenset(("false", "0", "f", "no", "n"))
+# Anything longer can't be one of the spellings above (plus some padding);
+# skip normalizing it and keep it out of the cache.
+_MAX_BOOL_STRING_LENGTH = 16
+
 
 def coerce_partial_utterances(value: object, default: bool = False) -> bool:
-    if isinstance(value, bool):
+    if type(value) is bool:
         return value
 
     if isinstance(value, (int, float)):
         return value != 0
 
-    if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in {"true", "1", "t", "yes", "y"}:
-            return True
-        if normalized in {"false", "0", "f", "no", "n"}:
-            return False
+    if isinstance(value, str) and len(value) <= _MAX_BOOL_STRING_LENGTH:
+        parsed = _parse_bool_string(value)
+        if parsed is not None:
+            return parsed
 
     return default
 
 
+# Only a handful of distinct spellings show up in practice, so memoize the
+# normalization. Bounded, since the values come from inbound messages.
+@functools.lru_cache(maxsize=64)
+def _parse_bool_string(value: str) -> bool | None:
+    normalized = value.strip().lower()
+    if normalized in _TRUTHY_STRINGS:
+        return True
+    if normalized in _FALSY_STRINGS:
+        return False
+    return None
+
+
 def coerce_min_utterance_length_seconds(value: object, default: float = 0.0) -> float:
-    if value in (None, ""):
+    if value is None or (isinstance(value, str) and not value):
         return default
 
     try:
         parsed = float(value)
-    except (TypeError, ValueError):
+    except (TypeError, ValueError, OverflowError):
         logging.warning(
-            f"Invalid minUtteranceLength value '{value}', falling back to {default}."
+            "Invalid minUtteranceLength value '%s', falling back to %s.",
+            value,
+            default,
         )
         return default
 
     if parsed < 0:
         logging.warning(
-            f"Negative minUtteranceLength value '{value}', clamping to {default}."
+            "Negative minUtteranceLength value '%s', clamping to %s.", value, default
         )
         return default
 